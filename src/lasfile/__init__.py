@@ -5,3 +5,4 @@ from .lasfile import read                             # noqa: F401, E261
 from .lasfile import write                            # noqa: F401, E261
 from .lasfile import api_from_las                     # noqa: F401, E261
 from .lasfile import error_check                      # noqa: F401, E261
+from .lasfile import clear_validation_cache           # noqa: F401, E261
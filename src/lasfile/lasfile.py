@@ -3,13 +3,14 @@
 import json
 import os
 import re
+import sys
 import traceback
+from functools import lru_cache
 from io import StringIO
-from numpy import genfromtxt
-# from numpy import array
-# from csv import reader
 from pandas import DataFrame
 from pandas import read_csv
+from pandas import to_numeric
+from pandas.errors import EmptyDataError
 import warnings
 from apinum import APINumber
 
@@ -132,20 +133,80 @@ for version, sections in known_secs.items():
     ]
     required_sections[version] = req_secs_list
 
-header_section_names = []
-data_section_names = []
-for version, sections in known_secs.items():
-    for section_name, sec_dict in sections.items():
-        if (
-            sec_dict['type'] == 'header' and
-            section_name not in header_section_names
-        ):
-            header_section_names.append(section_name)
-        elif (
-            sec_dict['type'] == 'data' and
-            section_name not in data_section_names
-        ):
-            data_section_names.append(section_name)
+# Known header and data section names across all versions, as
+# frozensets for constant time membership tests
+header_section_names = frozenset(
+    section_name
+    for sections in known_secs.values()
+    for section_name, sec_dict in sections.items()
+    if sec_dict['type'] == 'header'
+)
+data_section_names = frozenset(
+    section_name
+    for sections in known_secs.values()
+    for section_name, sec_dict in sections.items()
+    if sec_dict['type'] == 'data'
+)
+# Section type of each known section name
+_NAME_TO_TYPE = dict.fromkeys(data_section_names, 'data')
+_NAME_TO_TYPE.update(dict.fromkeys(header_section_names, 'header'))
+
+# Versions that share the version 2.0 layout
+_V2 = frozenset({"1.2", "2.0"})
+# Required version section mnemonics for each version, the tuples keep
+# the order missing mnemonics are reported in
+_REQ_V12_ORDER = ("VERS", "WRAP")
+_REQ_V3_ORDER = ("VERS", "WRAP", "DLM")
+_REQ_V12 = frozenset(_REQ_V12_ORDER)
+_REQ_V3 = frozenset(_REQ_V3_ORDER)
+# Required well section mnemonics for each version
+_REQ_V2_WELL_ORDER = (
+    "STRT", "STOP", "STEP", "NULL", "COMP", "WELL", "FLD", "LOC", "SRVC",
+    "DATE"
+)
+_REQ_V3_WELL_ORDER = (
+    "STRT", "STOP", "STEP", "NULL", "COMP", "WELL", "FLD", "LOC", "SRVC",
+    "CTRY", "DATE"
+)
+_REQ_V2_WELL = frozenset(_REQ_V2_WELL_ORDER)
+_REQ_V3_WELL = frozenset(_REQ_V3_WELL_ORDER)
+# Location and identifier mnemonics for v2 well sections, one of each
+# group is required
+_V2_LOC = ("CNTY", "STAT", "CTRY")
+_V2_LOC_ANY = frozenset(("PROV",) + _V2_LOC)
+_V2_ID = ("API", "UWI")
+# Well mnemonics that can hold an API number, matched case insensitively
+_UWI_API = frozenset({"UWI", "API"})
+# Valid version section values
+_WRAP_OK = frozenset({"YES", "NO"})
+_DLM_OK = frozenset({"SPACE", "COMMA", "TAB", ""})
+# Geographic mnemonic groups for version 3.0 well sections, either
+# latitude/longitude or X/Y coordinates are required
+_GEO_A = ("LATI", "LONG", "GDAT")
+_GEO_B = ("X", "Y", "GDAT", "HZCS")
+# Valid country codes for the CTRY mnemonic mapped to the mnemonics
+# required for that country
+_CTRY_REQ = {
+    "CA": ("PROV", "UWI", "LIC"),
+    "US": ("STAT", "CNTY", "API")
+}
+
+# Data delimiter characters keyed by both their DLM mnemonic value and
+# the character itself, None means any whitespace
+_DELIM_MAP = {
+    'SPACE': ' ',
+    'COMMA': ',',
+    'TAB': '\t',
+    ' ': ' ',
+    ',': ',',
+    '\t': '\t',
+    None: None
+}
+# Marker for lookups that found no value
+_SENTINEL = object()
+
+# Regex matches everything between '~V' and the next '~V' or '~W'
+_VERSION_SECTION_RE = re.compile(r'(~[V].+?)(?=~[VW]|$)', re.DOTALL)
 
 
 def get_version_num(data,
@@ -198,9 +259,8 @@ def get_version_num(data,
     # Parse input data based on its type
     if isinstance(data, str):
         try:
-            # If the data is a string, extract the version section
-            section_regex = re.compile(r'(~[V].+?)(?=~[VW]|$)', re.DOTALL)
-            version_section = re.findall(section_regex, data)[0]
+            # If the data is a string, extract the first version section
+            version_section = _VERSION_SECTION_RE.search(data).group(1)
             # Parse the version section into a DataFrame
             df = parse_header_section(version_section)
         except Exception as e:
@@ -297,12 +357,12 @@ def get_version_section(data,
         version number fails, if validating the version section fails,
         or if loading the section into a LASSection object fails.
     """
-    # Extract whole text of version section from raw data
-    # Regex matches everything between '~V' and '~V' or '~W'
-    section_regex = re.compile(r'(~[V].+?)(?=~[VW]|$)', re.DOTALL)
-    section_list = re.findall(section_regex, data)
-    # Take the first match, which should be the version section
-    version_section = section_list[0]
+    # Extract whole text of the first version section from raw data,
+    # stopping at the first match rather than scanning the whole file
+    match = _VERSION_SECTION_RE.search(data)
+    if match is None:
+        raise MissingRequiredSectionError("Could not find version section.")
+    version_section = match.group(1)
 
     # Try to parse version section into a DataFrame
     try:
@@ -333,16 +393,19 @@ def get_version_section(data,
         if version_num is not None:
             try:
                 wrap_val = df.loc[df['mnemonic'] == "WRAP", "value"].values[0]
-                if wrap_val.upper() == 'YES':
+                # The value has already been validated as YES or NO, so
+                # only the first character needs to be checked
+                wrap_flag = wrap_val[:1].lower()
+                if wrap_flag == 'y':
                     wrap = True
-                elif wrap_val.upper() == 'NO':
+                elif wrap_flag == 'n':
                     wrap = False
                 if "DLM" in df['mnemonic'].values:
                     dlm_val = df.loc[
                         df['mnemonic'] == "DLM", "value"].values[0]
             except Exception as e:
                 wrap = None
-                if version_num in ["1.2", "2.0"]:
+                if version_num in _V2:
                     raise MissingCriticalMnemonicError(
                         f"Could not get WRAP: {str(e)}"
                     )
@@ -365,9 +428,9 @@ def get_version_section(data,
                 delimiter=dlm_val,
                 parse_on_init=False,
                 validate_on_init=False,
-                wrap=wrap
+                wrap=wrap,
+                df=df
             )
-            loaded_section.df = df
             loaded_section.validated = True
             loaded_section.version_num = version_num
             return loaded_section
@@ -417,7 +480,7 @@ def parse_title_line(title_line,
         If the version number is not one of the expected values
         ("1.2", "2.0", "3.0").
     """
-    if version_num == "1.2" or version_num == "2.0":
+    if version_num in _V2:
         return parse_v2_title(title_line, all_lowercase=all_lowercase)
     elif version_num == "3.0":
         return parse_v3_title(
@@ -457,16 +520,15 @@ def parse_v2_title(title_line, all_lowercase=True):
     # Strip leading and trailing whitespace
     title_line = title_line.strip()
     # Check if it actually is a title line
-    if title_line.startswith('~'):
-        title_line = title_line.strip('~')
-        section_title = title_line[0]
-        if all_lowercase:
-            section_title = section_title.lower()
-        return section_title
-    else:
+    if not title_line or title_line[0] != '~':
         raise SectionTitleError(
             "Cannot parse title line. Title lines must begin with '~'."
         )
+    # The section title is the first character after the leading '~'
+    section_title = title_line[1]
+    if all_lowercase:
+        section_title = section_title.lower()
+    return section_title
 
 
 def parse_v3_title(title_line, all_lowercase=True, assocs=False):
@@ -508,45 +570,78 @@ def parse_v3_title(title_line, all_lowercase=True, assocs=False):
     # Strip leading and trailing whitespace
     title_line = title_line.strip()
     # Check if it actually is a title line
-    if title_line.startswith('~'):
-        # Strip leading '~'
-        title_line = title_line.strip('~')
-        # Check if there is an association
-        if '|' in title_line:
-            # If so, split the title line into the title and association
-            has_assoc = True
-            title_line, assoc = title_line.split('|')
-            # If the association is not empty, strip leading and
-            # trailing whitespace
-            if assoc.strip().split(' ')[0] != '':
-                assoc = assoc.strip().split(' ')[0]
-            # Otherwise, set the association to None
-            else:
-                assoc = None
-        # Extract the section title
-        if title_line.split(' ')[0] != '':
-            section_title = title_line.split(' ')[0]
-        else:
-            section_title = None
-        # Convert to lowercase if requested
-        if all_lowercase:
-            if section_title is not None:
-                section_title = section_title.lower()
-            if assocs and has_assoc:
-                if assoc is not None:
-                    assoc = assoc.lower()
-        # Return the section title and association if requested
-        if assocs and has_assoc:
-            return section_title, assoc
-        # Otherwise, just return the section title
-        else:
-            return section_title
-    else:
+    if not title_line or title_line[0] != '~':
         # If the line does not begin with '~', raise an exception
         raise SectionTitleError(
             "Cannot parse a line that does not begin with '~' as a "
             "title line."
         )
+    # Drop the leading '~'
+    body = title_line[1:]
+    # Check if there is an association
+    if '|' in body:
+        # If so, split the title line into the title and association
+        has_assoc = True
+        body, assoc = body.split('|')
+        # Keep the first word of the association, or None if empty
+        assoc = assoc.strip().split(' ')[0]
+        if assoc == '':
+            assoc = None
+    # Extract the section title
+    section_title = body.split(' ')[0]
+    if section_title == '':
+        section_title = None
+    # Convert to lowercase if requested
+    if all_lowercase:
+        if section_title is not None:
+            section_title = section_title.lower()
+        if assocs and has_assoc:
+            if assoc is not None:
+                assoc = assoc.lower()
+    # Return the section title and association if requested
+    if assocs and has_assoc:
+        return section_title, assoc
+    # Otherwise, just return the section title
+    else:
+        return section_title
+
+
+def _classify_suffix(name):
+    """
+    Returns the section type, 'header', 'data', or '' if unknown, for
+    a section name that is not a known section name, from the
+    '_parameters', '_definition' and '_data' parts of the name.
+    """
+    if '_parameters' in name or '_definition' in name:
+        return 'header'
+    elif '_data' in name:
+        return 'data'
+    else:
+        return ''
+
+
+def get_section_type(name):
+    """
+    Returns the section type, 'header', 'data', or '' if unknown, for
+    a section name as stored by split_sections.
+    """
+    section_type = _NAME_TO_TYPE.get(name)
+    if section_type is None:
+        section_type = _classify_suffix(name)
+    return section_type
+
+
+def _v3_section_name(section_title, v3_secs):
+    """
+    Returns the known section name for a version 3.0 section title, or
+    the title itself if it is not a known section name or alias.
+    """
+    if section_title in v3_secs:
+        return section_title
+    for known_sec_name, known_sec in v3_secs.items():
+        if section_title in known_sec["titles"]:
+            return known_sec_name
+    return section_title
 
 
 def split_sections(data, version_num, known_secs=known_secs):
@@ -589,7 +684,7 @@ def split_sections(data, version_num, known_secs=known_secs):
         values ("1.2", "2.0", "3.0").
     """
     # Split the data into sections based on the version number
-    if version_num == '1.2' or version_num == '2.0':
+    if version_num in _V2:
         # Use a regular expression to split the data into sections
         section_regex = re.compile(r'(~[VWPCOA].+?)(?=~[VWPCOA]|$)', re.DOTALL)
         sections = re.findall(section_regex, data)
@@ -622,10 +717,8 @@ def split_sections(data, version_num, known_secs=known_secs):
         section_dict = {}
         # Get the known sections for version 3.0
         known_secs = known_secs["3.0"]
-        known_sec_names = known_secs.keys()
         for section in sections:
             # Get the title line/header of the section
-            section_found = False
             try:
                 title_line_end = section.index('\n')
             except Exception as e:
@@ -640,21 +733,12 @@ def split_sections(data, version_num, known_secs=known_secs):
                 "3.0",
                 all_lowercase=True
             )
-            # If the section title is a known section name, store it
-            # using the known section name as the key
-            if section_title in known_sec_names:
-                section_dict[section_title] = section.strip()
-                section_found = True
-            # If the section title is not a known section name, check
-            # if it is an alias for a known section name then store it
-            # using the known section name as the key
-            else:
-                for known_sec_name, known_sec in known_secs.items():
-                    if section_title in known_sec["titles"]:
-                        section_dict[known_sec_name] = section.strip()
-                        section_found = True
-                if not section_found:
-                    section_dict[section_title] = section.strip()
+            # Store the section using the known section name as the
+            # key if the title is a known name or alias, otherwise use
+            # the title itself
+            section_dict[
+                _v3_section_name(section_title, known_secs)
+            ] = section.strip()
         # Return the dictionary of sections
         return section_dict
     else:
@@ -695,7 +779,7 @@ def parse_header_section(section_string, version_num='2.0', delimiter=None):
     """
     results = []
     lines = section_string.strip().split("\n")
-    if version_num == '2.0' or version_num == '1.2':
+    if version_num in _V2:
         # Skip comment, title, and empty lines
         for line in lines:
             mnemonic = None
@@ -714,9 +798,10 @@ def parse_header_section(section_string, version_num='2.0', delimiter=None):
                 line = line.strip()
                 # Get the mnemonic.
                 # The mnemonic is everything before the first period,
-                # stripped of whitespace.
+                # stripped of whitespace. Mnemonics repeat across
+                # sections and files so intern them.
                 frst_prd = line.index('.')
-                mnemonic = line[:frst_prd].strip()
+                mnemonic = sys.intern(line[:frst_prd].strip())
                 if version_num == '1.2' and mnemonic in [
                     'COMP',
                     'WELL',
@@ -819,9 +904,9 @@ def parse_header_section(section_string, version_num='2.0', delimiter=None):
                 line = line.strip()
                 # Get the mnemonic.
                 # The mnemonic is everything before the
-                # first period, stripped of whitespace
+                # first period, stripped of whitespace, and interned
                 frst_prd = line.index('.')
-                mnemonic = line[:frst_prd].strip()
+                mnemonic = sys.intern(line[:frst_prd].strip())
                 # Get the units.
                 # The units are everything between the first period and the
                 # first space after the first period, stripped of whitespace.
@@ -884,6 +969,32 @@ def parse_header_section(section_string, version_num='2.0', delimiter=None):
         return DataFrame(results)
 
 
+def _starts_like_header(section_string):
+    """
+    Checks whether the first content line of a section has the
+    "MNEM.UNIT VALUE : DESCRIPTION" layout of a header line. Comment,
+    title and empty lines are skipped. If there are no content lines the
+    section is treated as a header.
+    """
+    # Walk the lines one at a time rather than splitting the whole section,
+    # only the first content line is needed
+    start = 0
+    while start < len(section_string):
+        end = section_string.find("\n", start)
+        if end == -1:
+            end = len(section_string)
+        line = section_string[start:end].strip()
+        start = end + 1
+        if line == "" or line.startswith("#") or line.startswith("~"):
+            continue
+        frst_prd = line.find('.')
+        if frst_prd == -1:
+            return False
+        line_aft_frst_prd = line[frst_prd+1:]
+        return ' ' in line_aft_frst_prd and ':' in line_aft_frst_prd
+    return True
+
+
 def parse_data_section(
         raw_data,
         version_num,
@@ -918,7 +1029,21 @@ def parse_data_section(
     loaded_data : LASData
         The loaded data as a LASData object.
     """
-    filtered_data = re.sub(r'^[#~].*\n', '', raw_data, flags=re.MULTILINE)
+    # Skip the title and comment lines at the top of the section by
+    # slicing rather than running a regex over the whole data block
+    start = 0
+    while raw_data.startswith(('#', '~'), start):
+        line_end = raw_data.find('\n', start)
+        if line_end == -1:
+            break
+        start = line_end + 1
+    filtered_data = raw_data[start:]
+    # Only filter line by line if comments also appear within the data
+    if '\n#' in filtered_data or '\n~' in filtered_data:
+        filtered_data = '\n'.join(
+            line for line in filtered_data.split('\n')
+            if line[:1] not in ('#', '~')
+        )
     loaded_data = LASData(
         filtered_data,
         version_num,
@@ -928,6 +1053,19 @@ def parse_data_section(
     return loaded_data
 
 
+def _value_map(df):
+    """
+    Returns a dictionary mapping each mnemonic in a parsed header
+    DataFrame to its value. If a mnemonic is repeated, the first value
+    is kept.
+    """
+    # Build from the reversed rows so the first occurrence wins
+    return dict(zip(
+        reversed(df['mnemonic'].tolist()),
+        reversed(df['value'].tolist())
+    ))
+
+
 def validate_version(df, version_num=None):
     """
     Validates the version of a dataframe.
@@ -962,10 +1100,12 @@ def validate_version(df, version_num=None):
         values ("1.2", "2.0", "3.0").
     """
     validate_errors = []
-    if version_num in ["1.2", "2.0"]:
-        req_mnemonics = ["VERS", "WRAP"]
+    if version_num in _V2:
+        req_mnemonics = _REQ_V12
+        req_order = _REQ_V12_ORDER
     elif version_num == "3.0":
-        req_mnemonics = ["VERS", "WRAP", "DLM"]
+        req_mnemonics = _REQ_V3
+        req_order = _REQ_V3_ORDER
     else:
         validate_errors.append(
             UnknownVersionError(
@@ -974,18 +1114,17 @@ def validate_version(df, version_num=None):
         )
         return validate_errors
 
+    # Build a set of the mnemonics once for constant time lookups
+    mnem_set = set(df['mnemonic'].to_numpy().tolist())
     # Test if all required mnemonics are present
-    if not all(mnemonic in df.mnemonic.values for mnemonic in req_mnemonics):
+    if not req_mnemonics.issubset(mnem_set):
         # Try and fix the missing mnemonic error by adjusting mnemonic
         # case to upper.
-        if not all(
-            mnemonic in [val.upper() for val in df.mnemonic.values]
-            for mnemonic in req_mnemonics
-        ):
+        if not req_mnemonics.issubset({val.upper() for val in mnem_set}):
             # Make a list of the missing mnemonics
             missing_mnemonics = [
-                mnemonic for mnemonic in req_mnemonics
-                if mnemonic not in df.mnemonic.values
+                mnemonic for mnemonic in req_order
+                if mnemonic not in mnem_set
             ]
             validate_errors.append(
                 MissingCriticalMnemonicError(
@@ -998,13 +1137,16 @@ def validate_version(df, version_num=None):
             # Auto repair the mnemonic case
             df['mnemonic'] = df['mnemonic'].str.upper()
 
+    # Map mnemonics to values once for constant time lookups
+    val_map = _value_map(df)
+
     # Set empty wrap value
     wrap = None
 
     try:
-        wrap = df.loc[df['mnemonic'] == "WRAP", "value"].values[0]
+        wrap = val_map["WRAP"]
     except Exception as e:
-        if version_num in ["1.2", "2.0"]:
+        if version_num in _V2:
             validate_errors.append(
                 LASVersionError(f"Couldnt get WRAP value: {str(e)}")
             )
@@ -1012,8 +1154,8 @@ def validate_version(df, version_num=None):
         else:
             pass
 
-    if version_num in ["1.2", "2.0"]:
-        if wrap is not None and wrap.upper() not in ["YES", "NO"]:
+    if version_num in _V2:
+        if wrap is not None and wrap.upper() not in _WRAP_OK:
             validate_errors.append(
                 LASVersionError(
                     "Wrap value for versions 1.2 and 2.0 must be 'YES' "
@@ -1023,16 +1165,17 @@ def validate_version(df, version_num=None):
             return validate_errors
     elif version_num == "3.0":
         try:
-            dlm = df.loc[df['mnemonic'] == "DLM", "value"].values[0]
-            if "wrap" in locals():
-                if wrap is not None and wrap.upper() != "NO":
-                    validate_errors.append(
-                        LASVersionError(
-                            "Invalid wrap value. Must be 'NO' for version 3.0"
-                        )
+            dlm = val_map["DLM"]
+            if wrap is not None and wrap.upper() != "NO":
+                validate_errors.append(
+                    LASVersionError(
+                        "Invalid wrap value. Must be 'NO' for version 3.0"
                     )
-                    return validate_errors
-            if dlm.upper() not in ["SPACE", "COMMA", "TAB", None, '']:
+                )
+                return validate_errors
+            # An empty DLM value is parsed as None, normalize it before
+            # checking it against the valid delimiters
+            if (dlm or "").upper() not in _DLM_OK:
                 validate_errors.append(
                     LASVersionError(
                         "Invalid delimiter value for version 3.0, should be "
@@ -1048,6 +1191,85 @@ def validate_version(df, version_num=None):
     return validate_errors
 
 
+@lru_cache(maxsize=256)
+def _missing_well_mnemonics(version_num, mnem_set):
+    """
+    Finds the required well section mnemonics that can be checked from
+    the mnemonics alone. Results are cached by version and mnemonic set
+    since the same well layouts repeat across files.
+
+    Parameters:
+    ----------
+    version_num : str
+        The LAS version of the well section, "2.0" or "3.0".
+
+    mnem_set : frozenset
+        The mnemonics present in the well section.
+
+    Returns:
+    -------
+    tuple:
+        The missing mnemonics, in the order they are reported.
+    """
+    missing_mnemonics = []
+    if version_num == "3.0":
+        req_mnemonics = _REQ_V3_WELL
+        req_order = _REQ_V3_WELL_ORDER
+    else:
+        req_mnemonics = _REQ_V2_WELL
+        req_order = _REQ_V2_WELL_ORDER
+    # Check if all required mnemonics are present
+    if req_mnemonics.isdisjoint(mnem_set):
+        # Make a list of which mnemonics are missing
+        missing_mnemonics.extend(
+            mnemonic for mnemonic in req_order
+            if mnemonic not in mnem_set
+        )
+    if version_num == "3.0":
+        # Check that either LATI, LONG, GDAT or X, Y, GDAT, HZCS are
+        # present
+        geo_a_found = not mnem_set.isdisjoint(_GEO_A)
+        geo_b_found = not mnem_set.isdisjoint(_GEO_B)
+        if not (geo_a_found and geo_b_found):
+            # Make a list of which mnemonics are missing from the group
+            # that was started
+            if geo_a_found:
+                missing_mnemonics.extend(
+                    mnemonic for mnemonic in _GEO_A
+                    if mnemonic not in mnem_set
+                )
+            elif geo_b_found:
+                missing_mnemonics.extend(
+                    mnemonic for mnemonic in _GEO_B
+                    if mnemonic not in mnem_set
+                )
+    else:
+        # Check that either PROV or CNTY, STAT, CTRY are present, and
+        # either API or UWI. Neither group is found only when all of its
+        # mnemonics are missing.
+        if mnem_set.isdisjoint(_V2_LOC_ANY):
+            missing_mnemonics.extend(_V2_LOC)
+        if mnem_set.isdisjoint(_V2_ID):
+            missing_mnemonics.extend(_V2_ID)
+    return tuple(missing_mnemonics)
+
+
+def clear_validation_cache():
+    """
+    Clears the cached well section mnemonic checks. Useful for long
+    running processes that read many differently laid out files.
+
+    Parameters:
+    ----------
+    None
+
+    Returns:
+    -------
+    None
+    """
+    _missing_well_mnemonics.cache_clear()
+
+
 def validate_v2_well(df):
     """
     Validates the well section of a dataframe for version 2 LAS files.
@@ -1074,46 +1296,13 @@ def validate_v2_well(df):
     """
     validate_errors = []
     # Set of required mnemonics for version 2.0 well sections
-    req_mnemonics = [
-        "STRT",
-        "STOP",
-        "STEP",
-        "NULL",
-        "COMP",
-        "WELL",
-        "FLD",
-        "LOC",
-        "SRVC",
-        "DATE",
-    ]
-    # Instantiate an empty list to store missing mnemonics
-    missing_mnemonics = []
-    # Check if all required mnemonics are present
-    if all(mnemonic not in df.mnemonic.values for mnemonic in req_mnemonics):
-        # Make a list of which mnemonics are missing
-        for mnemonic in req_mnemonics:
-            if mnemonic not in df.mnemonic.values:
-                missing_mnemonics.append(mnemonic)
-    # Check that either PROV or CNTY, STAT, CTRY required mnemonics
-    # are present
-    if (
-        "PROV" not in df.mnemonic.values and
-        all(
-            mnemonic not in df.mnemonic.values
-            for mnemonic in ["CNTY", "STAT", "CTRY"]
-        )
-    ):
-        # Make a list of which mnemonics are missing
-        for mnemonic in ["CNTY", "STAT", "CTRY"]:
-            if mnemonic not in df.mnemonic.values:
-                missing_mnemonics.append(mnemonic)
-    if (
-            "API" not in df.mnemonic.values and
-            "UWI" not in df.mnemonic.values
-    ):
-        missing_mnemonics.append("API")
-        missing_mnemonics.append("UWI")
-    if missing_mnemonics != []:
+    req_mnemonics = _REQ_V2_WELL
+    # Pull the mnemonics out once, then build a set of them to look up
+    # the missing ones
+    mnems = df['mnemonic'].to_numpy()
+    mnem_set = frozenset(mnems.tolist())
+    missing_mnemonics = list(_missing_well_mnemonics("2.0", mnem_set))
+    if missing_mnemonics:
         validate_errors.append(
             MissingMnemonicError(
                 f"Missing required mnemonics: {missing_mnemonics}"
@@ -1124,19 +1313,20 @@ def validate_v2_well(df):
         # If the value in the mnemonic column is in the req_mnemonics
         # list, and the value in the errors column is not None, append
         # a the error to the validate_errors list
-        for index, row in df.iterrows():
-            if row["mnemonic"] in req_mnemonics and row["errors"] is not None:
+        errors = df['errors'].to_numpy()
+        for index, mnemonic, error in zip(df.index, mnems, errors):
+            if mnemonic in req_mnemonics and error is not None:
                 validate_errors.append(
                     LASFileCriticalError(
                         f"Error parsing required header line "
-                        f"'{index}', {row['errors']}"
+                        f"'{index}', {error}"
                     )
                 )
-            elif row["errors"] is not None:
+            elif error is not None:
                 validate_errors.append(
                     LASFileMinorError(
                         f"Error parsing header line '{index}', "
-                        f"{row['errors']}"
+                        f"{error}"
                     )
                 )
     return validate_errors
@@ -1171,104 +1361,26 @@ def validate_v3_well(df):
     """
     validate_errors = []
     # Set of required mnemonics for version 3.0 well sections
-    req_mnemonics = [
-        "STRT",
-        "STOP",
-        "STEP",
-        "NULL",
-        "COMP",
-        "WELL",
-        "FLD",
-        "LOC",
-        "SRVC",
-        "CTRY",
-        "DATE",
-    ]
-    # Set of valid country codes for the CTRY mnemonic
-    valid_country_codes = ["US", "CA"]
-    # Instantiate an empty list to store missing mnemonics
-    missing_mnemonics = []
-    # Check if all required mnemonics are present
-    if all(
-        mnemonic not in df.mnemonic.values
-        for mnemonic in req_mnemonics
-    ):
-        # Make a list of which mnemonics are missing
-        for mnemonic in req_mnemonics:
-            if mnemonic not in df.mnemonic.values:
-                missing_mnemonics.append(mnemonic)
-    # Check that either LATI, LONG, GDAT or X, Y, GDAT, HZCS are present
-    if (
-        all(
-            mnemonic not in df.mnemonic.values
-            for mnemonic in ["LATI", "LONG", "GDAT"]
-        )
-        or
-        all(
-            mnemonic not in df.mnemonic.values
-            for mnemonic in ["X", "Y", "GDAT", "HZCS"]
-        )
-    ):
-        if (
-            any(
-                mnemonic in df.mnemonic.values
-                for mnemonic in ["LATI", "LONG", "GDAT"]
-            )
-        ):
-            # Make a list of which mnemonics are missing
-            for mnemonic in ["LATI", "LONG", "GDAT"]:
-                if mnemonic not in df.mnemonic.values:
-                    missing_mnemonics.append(mnemonic)
-        elif (
-            any(
-                mnemonic in df.mnemonic.values
-                for mnemonic in ["X", "Y", "GDAT", "HZCS"]
-            )
-        ):
-            # Make a list of which mnemonics are missing
-            for mnemonic in ["X", "Y", "GDAT", "HZCS"]:
-                if mnemonic not in df.mnemonic.values:
-                    missing_mnemonics.append(mnemonic)
+    req_mnemonics = _REQ_V3_WELL
+    # Pull the mnemonics out once, then build a set of them to look up
+    # the missing ones
+    mnems = df['mnemonic'].to_numpy()
+    mnem_set = frozenset(mnems.tolist())
+    missing_mnemonics = list(_missing_well_mnemonics("3.0", mnem_set))
     # Check that CTRY is present and a valid valued and the required
     # mnemonics for the country code are present
-    if "CTRY" in df.mnemonic.values:
-        country_code = df.loc[
-            df["mnemonic"] == "CTRY", 'value'
-        ].values[0]
+    if "CTRY" in mnem_set:
+        country_code = _value_map(df)["CTRY"]
         if country_code is not None:
-            country_code = country_code.upper()
-            if country_code in valid_country_codes:
-                if country_code == "CA":
-                    if all(
-                        mnemonic not in df.mnemonic.values
-                        for mnemonic in ["PROV", "UWI", "LIC"]
-                    ):
-                        # Make a list of which mnemonics are missing
-                        for mnemonic in ["PROV", "UWI", "LIC"]:
-                            if mnemonic not in df.mnemonic.values:
-                                missing_mnemonics.append(mnemonic)
-                elif country_code == "US":
-                    if all(
-                        mnemonic not in df.mnemonic.values
-                        for mnemonic in ["STAT", "CNTY", "API"]
-                    ):
-                        # Make a list of which mnemonics are missing
-                        for mnemonic in ["STAT", "CNTY", "API"]:
-                            if mnemonic not in df.mnemonic.values:
-                                missing_mnemonics.append(mnemonic)
-                elif (
-                        country_code is None or
-                        country_code == ''
-                ):
-                    pass
-                else:
-                    validate_errors.append(
-                        LASFileMinorError(
-                            "Value for country code mnemonic is invalid: "
-                            f"{country_code}. Must be a valid internet "
-                            "country code."
-                        )
-                    )
+            # Get the mnemonics required for the country code, if it is
+            # one with requirements
+            ctry_req = _CTRY_REQ.get(country_code.upper())
+            if ctry_req is not None and mnem_set.isdisjoint(ctry_req):
+                # Make a list of which mnemonics are missing
+                missing_mnemonics.extend(
+                    mnemonic for mnemonic in ctry_req
+                    if mnemonic not in mnem_set
+                )
         else:
             validate_errors.append(
                 LASFileMinorError(
@@ -1286,19 +1398,20 @@ def validate_v3_well(df):
         # If the value in the mnemonic column is in the req_mnemonics
         # list, and the value in the errors column is not None, append
         # a the error to the validate_errors list
-        for index, row in df.iterrows():
-            if row["mnemonic"] in req_mnemonics and row["errors"] is not None:
+        errors = df['errors'].to_numpy()
+        for index, mnemonic, error in zip(df.index, mnems, errors):
+            if mnemonic in req_mnemonics and error is not None:
                 validate_errors.append(
                     LASFileCriticalError(
                         f"Error parsing required header line "
-                        f"'{index}', {row['errors']}"
+                        f"'{index}', {error}"
                     )
                 )
-            elif row["errors"] is not None:
+            elif error is not None:
                 validate_errors.append(
                     LASFileMinorError(
                         f"Error parsing header line '{index}', "
-                        f"{row['errors']}"
+                        f"{error}"
                     )
                 )
     return validate_errors
@@ -1334,32 +1447,20 @@ def validate_well(df, version_num):
     Exception:
         If validation fails in the respective validate function.
     """
-    validate_errors = []
-    if version_num == "1.2" or version_num == "2.0":
-        try:
-            errors = validate_v2_well(df)
-            if errors is not None:
-                for error in errors:
-                    validate_errors.append(error)
-        except Exception as e:
-            validate_errors.append(
-                LASFileCriticalError(
-                    f"Error validating well section: {e}"
-                )
-            )
-    if version_num == "3.0":
-        try:
-            errors = validate_v3_well(df)
-            if errors is not None:
-                for error in errors:
-                    validate_errors.append(error)
-        except Exception as e:
-            validate_errors.append(
-                LASFileCriticalError(
-                    f"Error validating well section: {e}"
-                )
+    if version_num in _V2:
+        validator = validate_v2_well
+    elif version_num == "3.0":
+        validator = validate_v3_well
+    else:
+        return []
+    try:
+        return validator(df)
+    except Exception as e:
+        return [
+            LASFileCriticalError(
+                f"Error validating well section: {e}"
             )
-    return validate_errors
+        ]
 
 
 def validate_curves(df, version_num):
@@ -1390,20 +1491,27 @@ def validate_curves(df, version_num):
     validate_errors = []
     # If ther is an errors column, check that there are no errors
     if "errors" in df.columns:
-        if not df.errors.isnull().all():
-            # If there are errors, append them to the validate_errors
-            # list
-            for index, row in df.iterrows():
-                if row["errors"] is not None:
-                    validate_errors.append(
-                        LASFileCriticalError(
-                            f"Error parsing curve line '{index}', "
-                            f"{row['errors']}"
-                        )
+        errors = df['errors'].to_numpy()
+        # If there are errors, append them to the validate_errors list
+        for index, error in zip(df.index, errors):
+            if error is not None:
+                validate_errors.append(
+                    LASFileCriticalError(
+                        f"Error parsing curve line '{index}', "
+                        f"{error}"
                     )
+                )
     return validate_errors
 
 
+# Validation functions for header sections keyed by (name, type)
+_SECTION_VALIDATORS = {
+    ('version', 'header'): validate_version,
+    ('well', 'header'): validate_well,
+    ('curves', 'header'): validate_curves
+}
+
+
 def unwrap_las_data(num_values, las_data):
     """
     Takes wrapped data, where a single depth value/row is split across
@@ -1481,7 +1589,7 @@ class LASData():
         Stores an error message if an unrecognized delimiter is found.
 
     data : numpy.ndarray
-        The parsed LAS data, stored as a numpy array.
+        The parsed LAS data as a numpy array, built from df on access.
 
     df : pandas.DataFrame
         The parsed LAS data, stored as a pandas DataFrame.
@@ -1513,40 +1621,30 @@ class LASData():
         self.version_num = version_num
         self.wrap = wrap
         self.delimiter = delimiter
-        # Initialize the delimiter dictionary
-        delim_dict = {
-            'SPACE': ' ',
-            'COMMA': ',',
-            'TAB': '\t'
-        }
-        delim = None
-        # Get the delimiter value from the dictionary
-        if self.delimiter is not None and self.delimiter in delim_dict.keys():
-            delim = delim_dict[self.delimiter]
-        # If the delimiter is a space, comma, tab, or None, use it
-        elif self.delimiter in delim_dict.values() or self.delimiter is None:
-            delim = self.delimiter
-        elif unrecognized_delimiters:
+        # Get the delimiter character from either the DLM mnemonic
+        # value or the character itself
+        delim = _DELIM_MAP.get(self.delimiter, _SENTINEL)
+        if delim is _SENTINEL:
+            # If unrecognized delimiters are not allowed, and the
+            # input delimiter is not recognized, raise an error
+            if not unrecognized_delimiters:
+                self.delimiter_error = (
+                    LASFileCriticalError(
+                        f"Unrecognized delimiter: '{self.delimiter}', "
+                        "unable to load!"
+                    )
+                )
+                return
             # If unrecognized delimiters are allowed, use the default
-            # delimiter if it is in the dictionary
-            if default_delimiter in delim_dict.values():
-                delim = default_delimiter
-            else:
+            # delimiter if it is recognized
+            delim = _DELIM_MAP.get(default_delimiter, _SENTINEL)
+            if delim is _SENTINEL:
                 # Otherwise, raise an error
+                delim = None
                 self.delimiter_error = LASFileCriticalError(
                     f"Unrecognized delimiter: '{self.delimiter}', and default "
                     f"delimiter '{default_delimiter} unable to load!"
                 )
-        else:
-            # If unrecognized delimiters are not allowed, and the
-            # input delimiter is not in the dictionary, raise an error
-            self.delimiter_error = (
-                LASFileCriticalError(
-                    f"Unrecognized delimiter: '{self.delimiter}', "
-                    "unable to load!"
-                )
-            )
-            return
         if wrap:
             if curve_names is not None:
                 num_values = len(curve_names)
@@ -1555,27 +1653,20 @@ class LASData():
                     self.raw_data
                 )
                 with StringIO(self.unwrapped_data) as f:
-                    # Catch any warnings that occur when reading the data
-                    with warnings.catch_warnings(record=True) as w:
-                        warnings.simplefilter("always")
-                        # Use numpy's genfromtxt to read the data into a
-                        # numpy array
-                        self.data = genfromtxt(
-                            f,
-                            delimiter=delim,
-                            invalid_raise=invalid_raise
-                        )
-                        # Convert the numpy array to a pandas DataFrame
-                        self.df = DataFrame(self.data)
-                        for warn in w:
-                            if issubclass(warn.category, UserWarning):
-                                # Store any read errors
-                                self.read_errors = [
-                                    err
-                                    for err
-                                    in str(warn.message).split("\n")
-                                ]
-                                return
+                    # Use pandas' C parser to read the data straight into a
+                    # DataFrame. Unwrapped rows are always joined by single
+                    # spaces and only complete rows are emitted.
+                    try:
+                        self.df = read_csv(f, sep=r'\s+', header=None)
+                    except EmptyDataError as e:
+                        # Nothing could be unwrapped, keep an empty frame so
+                        # the congruency check can still report on it
+                        self.df = DataFrame(columns=[0], dtype=float)
+                        self.read_errors = [str(e)]
+                        return
+                    # Convert each column to floats, values that aren't
+                    # numbers become NaN
+                    self.df = self.df.apply(to_numeric, errors='coerce')
             else:
                 self.read_errors = [
                     LASFileCriticalError(
@@ -1586,59 +1677,53 @@ class LASData():
         else:
             # Create a file-like object from the string
             with StringIO(self.raw_data) as f:
-                # Catch any warnings that occur when reading the data
+                # Catch any read warnings that occur when reading the data
                 with warnings.catch_warnings(record=True) as w:
-                    warnings.simplefilter("always")
-                    # Use numpy's genfromtxt to read the data into a
-                    # numpy array
-                    if delim == ' ':
-                        # self.data = genfromtxt(
-                        #     f,
-                        #     invalid_raise=invalid_raise
-                        # )
-                        self.df = read_csv(
-                            f,
-                            delim_whitespace=True,
-                            header=None
-                        )
-                    elif delim == ',':
-                        # csv_data = reader(f, delimiter=delim)
-                        # csv_data = list(csv_data)
-                        # self.data = array(csv_data)
-                        self.df = read_csv(
-                            f,
-                            delimiter=delim,
-                            header=None
-                        )
-                    elif delim == '\t':
-                        # self.data = genfromtxt(
-                        #     f,
-                        #     delimiter=delim,
-                        #     invalid_raise=invalid_raise
-                        # )
-                        self.df = read_csv(
-                            f,
-                            delimiter=delim,
-                            header=None
-                        )
-                    else:
-                        self.df = read_csv(
-                            f,
-                            delim_whitespace=True,
-                            header=None
-                        )
-                    # Convert the numpy array to a pandas DataFrame
-                    # self.df = DataFrame(self.data)
+                    warnings.simplefilter("always", UserWarning)
+                    # Use pandas' C parser to read the data straight
+                    # into a DataFrame, splitting on any whitespace unless
+                    # a comma or tab delimiter is set
+                    self.df = read_csv(
+                        f,
+                        sep=r'\s+' if delim is None or delim == ' ' else delim,
+                        header=None
+                    )
                     for warn in w:
                         if issubclass(warn.category, UserWarning):
                             # Store any read errors
-                            self.read_errors = [
-                                err
-                                for err
-                                in str(warn.message).split("\n")
-                            ]
+                            self.read_errors = str(warn.message).split("\n")
                             return
 
+    @property
+    def data(self):
+        """The parsed LAS data as a numpy array."""
+        return self.df.to_numpy()
+
+
+def _capture_tb(exc):
+    """
+    Captures the traceback of an exception without keeping its frames,
+    and their locals such as the raw file data, alive. Source lines are
+    only looked up when the traceback is formatted. Returns None if exc
+    is None.
+    """
+    if exc is None:
+        return None
+    return traceback.TracebackException(
+        type(exc), exc, exc.__traceback__, lookup_lines=False
+    )
+
+
+def _format_tb(captured):
+    """
+    Formats a traceback captured with _capture_tb the way
+    traceback.format_exc does while the exception is being handled.
+    None gives "NoneType: None".
+    """
+    if captured is None:
+        return "".join(traceback.format_exception(None, None, None))
+    return "".join(captured.format())
+
 
 class LASSection():
     """
@@ -1683,13 +1768,14 @@ class LASSection():
         Defaults to False.
 
     df : pandas.DataFrame
-        The DataFrame representing the parsed data of the section.
+        The DataFrame representing the parsed data of the section. An
+        already parsed DataFrame can be passed as `df` on init.
 
     Methods:
     -------
     __init__(self, name, raw_data, section_type, version_num,
     assoc=None, delimiter=None, parse_on_init=True,
-    validate_on_init=True)
+    validate_on_init=True, df=None)
         Initializes the LASSection object, parses the raw data,
         validates the parsed section if parse_on_init and
         validate_on_init are set to True.
@@ -1711,6 +1797,30 @@ class LASSection():
         snippet).
 
     """
+    # Declare every attribute up front so instances do not carry a
+    # per-instance __dict__
+    __slots__ = (
+        'name',
+        'raw_data',
+        'type',
+        'version_num',
+        'assocation',
+        'association',
+        'delimiter',
+        'validated',
+        'wrap',
+        'curve_names',
+        'parsed_section',
+        'parse_errors',
+        '_parse_tb_excs',
+        '_parse_tbs',
+        'validate_errors',
+        '_validate_tb_excs',
+        '_validate_tbs',
+        'validate_tb',
+        '_df'
+    )
+
     def __init__(
         self,
         name,
@@ -1722,9 +1832,11 @@ class LASSection():
         assoc=None,
         curve_names=None,
         parse_on_init=True,
-        validate_on_init=True
+        validate_on_init=True,
+        df=None
     ):
         # initialize attributes
+        self._df = df
         self.name = name
         self.raw_data = raw_data
         self.type = section_type
@@ -1737,7 +1849,9 @@ class LASSection():
         # parse section
         if parse_on_init:
             self.parse_errors = []
-            self.parse_tbs = []
+            # Store the captured tracebacks, they are only formatted
+            # when parse_tbs is read
+            self._parse_tb_excs = []
             try:
                 self.parse()
             except Exception as e:
@@ -1746,60 +1860,82 @@ class LASSection():
                         f"Couldn't parse section {self.name}: {str(e)}"
                     )
                 )
-                self.parse_tbs.append(traceback.format_exc())
+                self._parse_tb_excs.append(_capture_tb(e))
                 return
             if self.parse_errors == []:
                 del self.parse_errors
-            if self.parse_tbs == []:
-                del self.parse_tbs
+            if self._parse_tb_excs == []:
+                del self._parse_tb_excs
         # validate section
         if (
             parse_on_init and validate_on_init
         ):
             self.validate_errors = []
-            self.validate_tbs = []
-            # If there are no parse errors, proceed normally with validation
-            if not hasattr(self, 'parse_errors') or self.parse_errors == []:
+            self._validate_tb_excs = []
+            # If there are critical parse errors, return a critical
+            # validation error
+            if hasattr(self, 'parse_errors') and any(
+                isinstance(error, LASFileCriticalError)
+                for error in self.parse_errors
+            ):
+                self.validate_errors.append(
+                    LASFileCriticalError(
+                        "Couldn't validate section due to critical parse "
+                        "errors."
+                    )
+                )
+            # Otherwise attempt validation
+            else:
                 try:
                     self.validate()
-                    if self.validate_errors != []:
-                        self.validated = False
-                    else:
-                        self.validated = True
+                    self.validated = self.validate_errors == []
                 except Exception as e:
                     self.validated = False
                     self.validate_errors.append(e)
-                    self.validate_tbs.append(traceback.format_exc())
-            # If there are parse errors...
-            else:
-                # If there are critical parse errors, return a critical
-                # validation error
-                if any(
-                    isinstance(error, LASFileCriticalError)
-                    for error in getattr(self, 'parse_errors')
-                ):
-                    self.validate_errors.append(
-                        LASFileCriticalError(
-                            "Couldn't validate section due to critical parse "
-                            "errors."
-                        )
-                    )
-                # If there are no critical parse errors...
-                else:
-                    # attempt validation
-                    try:
-                        self.validate()
-                        if self.validate_errors != []:
-                            self.validated = False
-                        else:
-                            self.validated = True
-                    except Exception as e:
-                        self.validate_errors.append(e)
-                        self.validate_tbs.append(traceback.format_exc())
+                    self._validate_tb_excs.append(_capture_tb(e))
             if self.validate_errors == []:
                 del self.validate_errors
-            if self.validate_tbs == []:
-                del self.validate_tbs
+            if self._validate_tb_excs == []:
+                del self._validate_tb_excs
+
+    @property
+    def df(self):
+        """
+        The DataFrame of the parsed section.
+        """
+        if self._df is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute 'df'"
+            )
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        self._df = value
+
+    @property
+    def parse_tbs(self):
+        """
+        The formatted tracebacks of the parse errors, formatted from the
+        captured tracebacks on first access.
+        """
+        excs = self._parse_tb_excs
+        tbs = getattr(self, '_parse_tbs', None)
+        if tbs is None or len(tbs) != len(excs):
+            tbs = self._parse_tbs = [_format_tb(exc) for exc in excs]
+        return tbs
+
+    @property
+    def validate_tbs(self):
+        """
+        The formatted tracebacks of the validation errors, formatted from
+        the captured tracebacks on first access.
+        """
+        excs = self._validate_tb_excs
+        tbs = getattr(self, '_validate_tbs', None)
+        if tbs is None or len(tbs) != len(excs):
+            tbs = self._validate_tbs = [_format_tb(exc) for exc in excs]
+        return tbs
 
     def parse(self):
         """
@@ -1817,9 +1953,11 @@ class LASSection():
         -------
         None
         """
-        if '\n' in self.raw_data:
+        # Find the end of the title line, a single scan that stops at
+        # the first newline
+        title_line_end = self.raw_data.find('\n')
+        if title_line_end != -1:
             # parse title line
-            title_line_end = self.raw_data.index('\n')
             title_line = self.raw_data[:title_line_end].strip()
             if '|' in title_line:
                 result = parse_title_line(
@@ -1856,27 +1994,10 @@ class LASSection():
                                         error
                                     )
                 except Exception as e:
-                    # if it is a required section, return a critical error
-                    # otherwise return a minor error
-                    if (
-                        self.name.lower() in
-                        required_sections[self.version_num]
-                    ):
-                        self.parse_errors.append(
-                            RequiredSectionParseError(
-                                f"Couldn't parse '{self.name}' data: {str(e)}"
-                            )
-                        )
-                        self.parse_tbs.append(traceback.format_exc())
-                        return
-                    else:
-                        self.parse_errors.append(
-                            SectionParseError(
-                                f"Couldn't parse '{self.name}' data: {str(e)}"
-                            )
-                        )
-                        self.parse_tbs.append(traceback.format_exc())
-                        return
+                    self.add_parse_error(
+                        f"Couldn't parse '{self.name}' data: {str(e)}"
+                    )
+                    return
             # if the section is a data section, parse it as such
             elif self.type.lower() == 'data':
                 try:
@@ -1906,30 +2027,18 @@ class LASSection():
                                     error
                                 )
                 except Exception as e:
-                    # if it is a required section, return a critical error
-                    # otherwise return a minor error
-                    if (
-                        self.name.lower() in
-                        required_sections[self.version_num]
-                    ):
-                        self.parse_errors.append(
-                            RequiredSectionParseError(
-                                f"Couldn't parse '{self.name}' data: {str(e)}"
-                            )
-                        )
-                        self.parse_tbs.append(traceback.format_exc())
-                        return
-                    else:
-                        self.parse_errors.append(
-                            SectionParseError(
-                                f"Couldn't parse '{self.name}' data: {str(e)}"
-                            )
-                        )
-                        self.parse_tbs.append(traceback.format_exc())
-                        return
+                    self.add_parse_error(
+                        f"Couldn't parse '{self.name}' data: {str(e)}"
+                    )
+                    return
             # parse other sections
             else:
                 try:
+                    # A header parse of a section whose first line is not
+                    # a header line always records an error, so go
+                    # straight to parsing it as data
+                    if not _starts_like_header(self.raw_data):
+                        raise Exception('Not a header section')
                     self.parsed_section = parse_header_section(
                         self.raw_data,
                         version_num=self.version_num
@@ -1954,48 +2063,40 @@ class LASSection():
                         self.df = self.parsed_section.df
                         self.type = 'data'
                     except Exception as e:
-                        # Test if it is a required section or not and
-                        # return the appropriate error
-                        if (
-                            self.name.lower() in
-                            required_sections[self.version_num]
-                        ):
-                            self.parse_errors.append(
-                                RequiredSectionParseError(
-                                    f"Couldn't parse '{self.name}' data: "
-                                    f"{str(e)}"
-                                )
-                            )
-                            self.parse_tbs.append(traceback.format_exc())
-                        else:
-                            self.parse_errors.append(
-                                SectionParseError(
-                                    f"Couldn't parse '{self.name}' data: "
-                                    f"{str(e)}"
-                                )
-                            )
-                            self.parse_tbs.append(traceback.format_exc())
+                        self.add_parse_error(
+                            f"Couldn't parse '{self.name}' data: {str(e)}"
+                        )
                         return
         # if raw data is only one line or less
         else:
-            # Test if it is a critical required section or not and
-            # return the appropriate error
-            if self.name.lower() in required_sections[self.version_num]:
-                self.parse_errors.append(
-                    RequiredSectionParseError(
-                        "Couln't parse, raw section data is only one line or "
-                        "less."
-                    )
-                )
-                self.parse_tbs.append(traceback.format_exc())
-            else:
-                self.parse_errors.append(
-                    SectionParseError(
-                        "Couln't parse, raw section data is only one line or "
-                        "less."
-                    )
-                )
-                self.parse_tbs.append(traceback.format_exc())
+            self.add_parse_error(
+                "Couln't parse, raw section data is only one line or less."
+            )
+
+    def add_parse_error(self, message):
+        """
+        Records a parse error for the section along with the traceback
+        of the exception being handled, if any.
+
+        The error is a critical RequiredSectionParseError if the section
+        is required for the file's version, otherwise it is a minor
+        SectionParseError.
+
+        Parameters:
+        ----------
+        message : str
+            The error message.
+
+        Returns:
+        -------
+        None
+        """
+        if self.name.lower() in required_sections[self.version_num]:
+            self.parse_errors.append(RequiredSectionParseError(message))
+        else:
+            self.parse_errors.append(SectionParseError(message))
+        # Capture the traceback of the exception being handled, if any
+        self._parse_tb_excs.append(_capture_tb(sys.exc_info()[1]))
 
     def validate(self):
         """
@@ -2015,35 +2116,27 @@ class LASSection():
         -------
         None
         """
-
-        if self.name == 'version' and self.type == 'header':
-            errors = validate_version(self.parsed_section, self.version_num)
-            if errors != []:
-                for error in errors:
-                    self.validate_errors.append(error)
-        elif self.name == 'well' and self.type == 'header':
-            errors = validate_well(self.parsed_section, self.version_num)
-            if errors != []:
-                for error in errors:
-                    self.validate_errors.append(error)
-        elif self.name == 'curves' and self.type == 'header':
-            errors = validate_curves(self.parsed_section, self.version_num)
-            if errors != []:
-                for error in errors:
-                    self.validate_errors.append(error)
-        elif self.name == 'data' and self.type == 'data':
-            if hasattr(self.parsed_section, 'read_errors'):
-                for error in self.parsed_section.read_errors:
-                    self.validate_errors.append(error)
-        elif '_definition' in self.name and self.type == 'header':
-            errors = validate_curves(self.parsed_section, self.version_num)
-            if errors != []:
-                for error in errors:
-                    self.validate_errors.append(error)
-        elif '_data' in self.name and self.type == 'data':
-            if hasattr(self.parsed_section, 'read_errors'):
-                for error in self.parsed_section.read_errors:
-                    self.validate_errors.append(error)
+        # Look up the validation function for the section
+        validator = _SECTION_VALIDATORS.get((self.name, self.type))
+        # Definition sections are validated like the curves section
+        if (
+            validator is None and
+            self.type == 'header' and
+            '_definition' in self.name
+        ):
+            validator = validate_curves
+        if validator is not None:
+            self.validate_errors.extend(
+                validator(self.parsed_section, self.version_num)
+            )
+        # Data sections are validated by their read errors
+        elif (
+            self.type == 'data' and
+            (self.name == 'data' or '_data' in self.name)
+        ):
+            self.validate_errors.extend(
+                getattr(self.parsed_section, 'read_errors', [])
+            )
 
     def __repr__(self):
         return (
@@ -2116,26 +2209,32 @@ def check_definitions_and_format_data(def_section, data_section):
     ----
     If the number of rows in the definition section matches the number
     of columns in the data section, it renames the columns of the data
-    section with the column names of the definition section. This
+    section with the mnemonics of the definition section. This
     operation modifies the data_section in-place.
     """
-    def_rows = def_section.df.shape[0]
-    # print(def_rows)
-    data_cols = data_section.df.shape[1]
-    # print(data_cols)
-    if hasattr(def_section, 'df') and hasattr(data_section, 'df'):
-        def_rows = def_section.df.shape[0]
-        # print(def_rows)
-        data_cols = data_section.df.shape[1]
-        # print(data_cols)
-        if def_rows == data_cols:
-            data_section.df.rename(
-                columns=dict(zip(
-                        data_section.df.columns,
-                        def_section.df.columns
-                )),
-                inplace=True
-            )
+    def_df = getattr(def_section, 'df', None)
+    data_df = getattr(data_section, 'df', None)
+    if (
+        def_df is None or
+        data_df is None or
+        def_df.shape[0] != data_df.shape[1]
+    ):
+        return
+    # Assign the column labels directly rather than building a rename
+    # mapping
+    data_df.columns = def_df['mnemonic'].values
+
+
+# LASFile error attributes and their labels, in the order they are
+# shown by LASFile.__str__
+_ERROR_FIELDS = (
+    ('open_error', 'Open Error'),
+    ('read_error', 'Reading Error'),
+    ('version_error', 'Version Extraction Error'),
+    ('split_error', 'Section Splitting Error'),
+    ('parse_errors', 'Parsing Error'),
+    ('validate_errors', 'Validation Error')
+)
 
 
 class LASFile():
@@ -2156,7 +2255,8 @@ class LASFile():
         when errors occur.
 
     sections : list of LASSection
-        The sections of the LAS file, parsed and validated.
+        The sections of the LAS file, parsed and validated. Each section
+        can also be accessed as an attribute by its name, e.g. las.well.
 
     version : LASSection
         The version section of the LAS file.
@@ -2228,6 +2328,14 @@ class LASFile():
     get_api(self)
         Attempts to extract the API number from the LAS file.
 
+    __getattr__(self, name)
+        Returns a deferred traceback or the section with the given name,
+        if there is one.
+
+    __dir__(self)
+        Lists the normal attributes along with the sections and any deferred
+        tracebacks that __getattr__ can return.
+
     __str__(self)
         Returns a user-friendly string representation of the LASFile object,
         including any errors that occurred.
@@ -2236,6 +2344,8 @@ class LASFile():
         if file_path is not None:
             self.file_path = file_path
             self.sections = []
+            # Sections keyed by name, for attribute access to sections
+            self._sections_by_name = {}
             self.curve_names = None
             # Try to open and read the file into a string
             data = self.read_file(self.file_path)
@@ -2251,33 +2361,102 @@ class LASFile():
 
             self.set_error_attributes()
 
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails. Read straight
+        # from __dict__ so a LASFile without sections doesn't recurse.
+        attrs = self.__dict__
+        # Format a deferred traceback on first access and store it as a
+        # normal attribute
+        deferred = attrs.get('_deferred_tbs')
+        if deferred is not None and name in deferred:
+            wrapper, prefix, captured = deferred.pop(name)
+            value = wrapper(f"{prefix}{_format_tb(captured)}")
+            setattr(self, name, value)
+            return value
+        # Otherwise look the name up in the sections
+        try:
+            return attrs['_sections_by_name'][name]
+        except KeyError:
+            raise AttributeError(
+                f"'LASFile' object has no attribute '{name}'"
+            ) from None
+
+    def __dir__(self):
+        # Add the names __getattr__ resolves so they still show up in dir()
+        attrs = self.__dict__
+        return set(super().__dir__()).union(
+            attrs.get('_sections_by_name', {}),
+            attrs.get('_deferred_tbs', {})
+        )
+
+    def _defer_tb(self, name, exc, prefix="", wrapper=str):
+        """
+        Captures the traceback of an exception so it is only formatted
+        when the traceback attribute is first read. No frames are kept
+        alive, so the file data they reference can be freed.
+
+        Parameters:
+        ----------
+        name : str
+            The name of the traceback attribute, e.g. 'open_tb'.
+
+        exc : Exception
+            The exception being handled.
+
+        prefix : str, optional
+            Text to put before the formatted traceback.
+
+        wrapper : callable, optional
+            Called with the prefixed traceback string to build the
+            attribute value. Defaults to str.
+
+        Returns:
+        -------
+        None
+        """
+        if '_deferred_tbs' not in self.__dict__:
+            self._deferred_tbs = {}
+        self._deferred_tbs[name] = (wrapper, prefix, _capture_tb(exc))
+
     def read_file(self, file_path):
         # Try to open the file
         try:
-            with open(self.file_path, 'r') as f:
+            with open(self.file_path, 'rb') as f:
                 try:
-                    data = f.read()
+                    # Read the raw bytes and decode them in one call,
+                    # LAS files are ASCII so only fall back to utf-8
+                    # when that fails, then to latin-1 so stray legacy
+                    # bytes (e.g. a cp1252 degree sign) never make the
+                    # file unreadable
+                    raw = f.read()
+                    try:
+                        data = raw.decode('ascii')
+                    except UnicodeDecodeError:
+                        try:
+                            data = raw.decode('utf-8')
+                        except UnicodeDecodeError:
+                            data = raw.decode('latin-1')
+                    # Normalize line endings as text mode would
+                    if '\r' in data:
+                        data = data.replace('\r\n', '\n').replace('\r', '\n')
                     return data
                 except Exception as e:
                     self.read_error = LASFileCriticalError(
                         f"Couldn't read file: {str(e)}"
                     )
-                    tb = traceback.format_exc()
-                    self.read_tb = f"Couldn't read file: {tb}"
+                    self._defer_tb('read_tb', e, "Couldn't read file: ")
                     return
-        except FileNotFoundError:
+        except FileNotFoundError as e:
             self.open_error = LASFileOpenError(
                 f"File not found: {self.file_path}"
             )
-            tb = traceback.format_exc()
-            self.open_tb = f"File not found: {tb}"
+            self._defer_tb('open_tb', e, "File not found: ")
             return
         except Exception as e:
             self.open_error = LASFileOpenError(
                 f"Error opening file: {str(e)}"
             )
-            tb = traceback.format_exc()
-            self.open_tb = f"Error opening file: {tb}"
+            self._defer_tb('open_tb', e, "Error opening file: ")
             return
 
     def get_version(self, data):
@@ -2289,6 +2468,7 @@ class LASFile():
             self.wrap = self.version.wrap
             self.delimiter = self.version.delimiter
             self.sections.append(self.version)
+            self._sections_by_name['version'] = self.version
             return
         # If a version couldn't be extracted, set the version error and
         # traceback, and return
@@ -2296,9 +2476,11 @@ class LASFile():
             self.version_error = LASFileCriticalError(
                 f"Couldn't get version: {str(e)}"
             )
-            tb = traceback.format_exc()
-            self.version_tb = LASFileCriticalError(
-                f"Couldn't get version: {tb}"
+            self._defer_tb(
+                'version_tb',
+                e,
+                "Couldn't get version: ",
+                wrapper=LASFileCriticalError
             )
             self.version_num = None
             return
@@ -2325,7 +2507,7 @@ class LASFile():
                     self.split_error = LASFileSplitError(
                         f"Couldn't split into sections: {str(e)}"
                     )
-                    self.split_tb = traceback.format_exc()
+                    self._defer_tb('split_tb', e)
                     return
                 # If the sections were split correctly, check that the
                 # minimum required sections are present and not empty
@@ -2386,32 +2568,18 @@ class LASFile():
                 if name == 'version':
                     continue
                 # Get the section type
+                section_type = get_section_type(name)
+                # If the curves section has already been built, look it
+                # up by name and get the curve names from it
+                curves_section = self._sections_by_name.get('curves')
                 if (
-                    name in header_section_names or
-                    '_parameters' in name or
-                    '_definition' in name
+                    curves_section is not None and
+                    error_check(curves_section)
                 ):
-                    section_type = 'header'
-                elif (
-                    name in data_section_names or
-                    '_data' in name
-                ):
-                    section_type = 'data'
-                else:
-                    section_type = ''
-                # check if the sections attribute exists
-                if hasattr(self, 'sections'):
-                    # If it exists, check that the curves section is in
-                    # the list of sections stored in the sections attribute
-                    for section in self.sections:
-                        if section.name == 'curves':
-                            curves_section = section
-                            if error_check(curves_section):
-                                if hasattr(curves_section, 'df'):
-                                    self.curve_names = (
-                                        curves_section.
-                                        df['mnemonic'].tolist()
-                                    )
+                    if hasattr(curves_section, 'df'):
+                        self.curve_names = (
+                            curves_section.df['mnemonic'].tolist()
+                        )
                 # Try to create the section
                 try:
                     section = LASSection(
@@ -2423,7 +2591,10 @@ class LASFile():
                         delimiter=self.delimiter,
                         curve_names=self.curve_names
                     )
+                    # Store the section and key it by name so it can be
+                    # accessed as an attribute of the LASFile
                     self.sections.append(section)
+                    self._sections_by_name[name] = section
                 except Exception as e:
                     # Try to create the section anyway without parsing
                     # or validating
@@ -2441,17 +2612,13 @@ class LASFile():
                         )
                         section.parse_errors = [e]
                         self.sections.append(section)
+                        self._sections_by_name[name] = section
                     except Exception as e:
                         if hasattr(self, 'parse_errors'):
                             self.parse_errors[name] = e
                         else:
                             self.parse_errors = {name: e}
 
-            # Set LASFile section attributes
-            for section in self.sections:
-                # Set each section as an attribute of the LASFile
-                setattr(self, section.name, section)
-
         # Run the function to ensure the curve and data sections
         # have the same number of curve mnemonics/data columns
         self.ensure_curve_and_data_congruency()
@@ -2466,105 +2633,95 @@ class LASFile():
 
     def ensure_curve_and_data_congruency(self):
         """Check for definition/curve and data column congruency"""
-        # Check that the curves and data sections exist
-        if hasattr(self, "curves") and hasattr(self, "data"):
-            # Check that the curves and data sections were parsed
-            # correctly into dataframes
-            if (
-                hasattr(getattr(self, "curves"), 'df') and
-                hasattr(getattr(self, "data"), 'df')
-            ):
-                # Get the number of rows/curve definitions and the
-                # number of columns/data points
-                def_rows = getattr(self, "curves").df.shape[0]
-                curves_df = getattr(self, "curves").df
-                data_cols = getattr(self, "data").df.shape[1]
-                # If the number of rows/curve definitions in the
-                # definition section matches the number of columns in
-                # the data section, rename the columns of the data
-                # section to the curve mnemonics
-                if def_rows == data_cols:
-                    # Check if there are repeated curve mnemonics
-                    if (
-                        not len(
-                            curves_df.mnemonic.unique()
-                        ) == len(
-                            curves_df.mnemonic
-                        )
-                    ):
-                        # Get a list of the mnemonics that are repeated
-                        repeated_mnemonics = curves_df.mnemonic[
-                            curves_df.mnemonic.duplicated(keep=False)
-                        ].unique()
-                        # For each unique repeated mnemonic make a df of
-                        # the repeated mnemonics
-                        for mnemonic in repeated_mnemonics:
-                            # Get a df of the repeated mnemonics
-                            repeated_mnemonics_df = (
-                                curves_df.loc[
-                                    curves_df['mnemonic'] == mnemonic
-                                ]
+        # Get the number of rows/curve definitions and the number of
+        # columns/data points. If the curves or data section is missing
+        # or wasn't parsed into a dataframe there is nothing to check.
+        try:
+            curves_df = self.curves.df
+            def_rows = curves_df.shape[0]
+            data_cols = self.data.df.shape[1]
+        except AttributeError:
+            return
+        # If the number of rows/curve definitions in the
+        # definition section matches the number of columns in
+        # the data section, rename the columns of the data
+        # section to the curve mnemonics
+        if def_rows == data_cols:
+            # Get the curve mnemonics once
+            mnemonics = curves_df['mnemonic']
+            # Check if there are repeated curve mnemonics
+            if not mnemonics.is_unique:
+                # Get a list of the mnemonics that are repeated
+                repeated_mnemonics = mnemonics[
+                    mnemonics.duplicated(keep=False)
+                ].unique()
+                # For each unique repeated mnemonic make a df of
+                # the repeated mnemonics
+                for mnemonic in repeated_mnemonics:
+                    # Get a df of the repeated mnemonics
+                    repeated_mnemonics_df = (
+                        curves_df.loc[
+                            curves_df['mnemonic'] == mnemonic
+                        ]
+                    )
+                    # Reset the index of the repeated mnemonics df
+                    repeated_mnemonics_df.reset_index(inplace=True)
+                    # for each row in the repeated mnemonics df,
+                    # append an underscore and the index digit
+                    # to the end of the mnemonic, except the
+                    # first instance of the repeated mnemonic
+                    # format: {old_index: [new_mnemonic]}
+                    new_repeated_mnemonics = {}
+                    for index, row in repeated_mnemonics_df.iterrows():
+                        if index == 0:
+                            new_repeated_mnemonics[row['index']] = (
+                                row['mnemonic']
+                            )
+                        else:
+                            new_repeated_mnemonics[row['index']] = (
+                                f"{row['mnemonic']}_{index}"
                             )
-                            # Reset the index of the repeated mnemonics df
-                            repeated_mnemonics_df.reset_index(inplace=True)
-                            # for each row in the repeated mnemonics df,
-                            # append an underscore and the index digit
-                            # to the end of the mnemonic, except the
-                            # first instance of the repeated mnemonic
-                            # format: {old_index: [new_mnemonic]}
-                            new_repeated_mnemonics = {}
-                            for index, row in repeated_mnemonics_df.iterrows():
-                                if index == 0:
-                                    new_repeated_mnemonics[row['index']] = (
-                                        row['mnemonic']
-                                    )
-                                else:
-                                    new_repeated_mnemonics[row['index']] = (
-                                        f"{row['mnemonic']}_{index}"
-                                    )
 
-                            # Create a copy of the curves df
-                            new_curves_df = curves_df
-                            # replace the old mnemonics with the new
-                            # ones by index
-                            for index, new_mnemonic in \
-                                    new_repeated_mnemonics.items():
-                                new_curves_df.loc[index, 'mnemonic'] = (
-                                    new_mnemonic
-                                )
-                            # Replace the curves df with the new one
-                            setattr(
-                                getattr(self, 'curves'),
-                                'df',
-                                new_curves_df)
-                    # Rename the columns of the data section
-                    getattr(self, "data").df.rename(
-                        columns=dict(zip(
-                            getattr(self, "data").df.columns,
-                            getattr(self, "curves").df.mnemonic.values
-                        )),
-                        inplace=True
-                    )
-                # If the number of rows/curve definitions in the
-                # definition section does not match the number of
-                # columns in the data section, set a validation error
-                else:
-                    if not hasattr(getattr(self, 'curves'), 'validate_errors'):
-                        setattr(getattr(self, 'curves'), 'validate_errors', [])
-                    if not hasattr(getattr(self, 'data'), 'validate_errors'):
-                        setattr(getattr(self, 'data'), 'validate_errors', [])
-                    getattr(self, 'curves').validate_errors.append(
-                        LASFileCriticalError(
-                            "Curves and data sections are not "
-                            "congruent."
-                        )
-                    )
-                    getattr(self, 'data').validate_errors.append(
-                        LASFileCriticalError(
-                            "Curves and data sections are not "
-                            "congruent."
+                    # Create a copy of the curves df
+                    new_curves_df = curves_df
+                    # replace the old mnemonics with the new
+                    # ones by index
+                    for index, new_mnemonic in \
+                            new_repeated_mnemonics.items():
+                        new_curves_df.loc[index, 'mnemonic'] = (
+                            new_mnemonic
                         )
-                    )
+                    # Replace the curves df with the new one
+                    setattr(
+                        getattr(self, 'curves'),
+                        'df',
+                        new_curves_df)
+            # Rename the columns of the data section by
+            # assigning the curve mnemonics in order, read again
+            # since repeated mnemonics may have been renamed
+            getattr(self, "data").df.columns = (
+                curves_df['mnemonic'].values
+            )
+        # If the number of rows/curve definitions in the
+        # definition section does not match the number of
+        # columns in the data section, set a validation error
+        else:
+            if not hasattr(getattr(self, 'curves'), 'validate_errors'):
+                setattr(getattr(self, 'curves'), 'validate_errors', [])
+            if not hasattr(getattr(self, 'data'), 'validate_errors'):
+                setattr(getattr(self, 'data'), 'validate_errors', [])
+            getattr(self, 'curves').validate_errors.append(
+                LASFileCriticalError(
+                    "Curves and data sections are not "
+                    "congruent."
+                )
+            )
+            getattr(self, 'data').validate_errors.append(
+                LASFileCriticalError(
+                    "Curves and data sections are not "
+                    "congruent."
+                )
+            )
 
     def add_mnemonics_to_data_sections(self):
         """
@@ -2635,65 +2792,63 @@ class LASFile():
             self.errors['validate_errors'] = getattr(self, 'validate_errors')
 
     def __str__(self):
-        s = f"LASFile: {self.file_path}\n"
-        if hasattr(self, 'open_error'):
-            s += f"Open Error: {self.open_error}\n"
-        if hasattr(self, 'read_error'):
-            s += f"Reading Error: {self.read_error}\n"
-        if hasattr(self, 'version_error'):
-            s += f"Version Extraction Error: {self.version_error}\n"
-        if hasattr(self, 'split_error'):
-            s += f"Section Splitting Error: {self.split_error}\n"
-        if hasattr(self, 'parse_errors'):
-            s += f"Parsing Error: {self.parse_errors}\n"
-        if hasattr(self, 'validate_errors'):
-            s += f"Validation Error: {getattr(self, 'validate_errors')}"
+        # Collect the parts and join them once at the end
+        parts = [f"LASFile: {self.file_path}\n"]
+        # Add a line for each error attribute that is set
+        for attr, label in _ERROR_FIELDS:
+            error = getattr(self, attr, _SENTINEL)
+            if error is not _SENTINEL:
+                parts.append(f"{label}: {error}\n")
         if hasattr(self, 'sections'):
-            for section in self.sections:
-                s += str(f"  {section}")
-        return s
+            parts.extend(f"  {section}" for section in self.sections)
+        return "".join(parts)
 
     def get_api(self):
         # If the las file has a well section, try to get the api from it
         if hasattr(self, 'well'):
             try:
-                # Check if 'UWI', 'uwi', 'API', or 'api' is present in the
+                # Check if 'UWI' or 'API' in any case is present in the
                 # 'mnemonic' column
-                mask = getattr(self, "well").df['mnemonic'].str.lower().isin(
-                    ['uwi', 'api']
+                mask = getattr(self, "well").df['mnemonic'].str.upper().isin(
+                    _UWI_API
                 )
-                # Filter the DataFrame using the mask
-                filtered_df = getattr(self, "well").df[mask]
-                # Get the corresponding values for the matched mnemonics
-                matched_values = filtered_df['value'].tolist()
-
-                # Attempt to load all matched values into an APINumber
-                # objects
+                # Get the values for the matched mnemonics straight from the
+                # value column rather than filtering the whole DataFrame
+                matched_values = getattr(self, "well").df['value'].to_numpy()[
+                    mask.to_numpy()
+                ].tolist()
+
+                # Attempt to load all non null matched values into APINumber
+                # objects, keeping each valid value with its APINumber so
+                # none have to be built again
                 valid_values = []
                 for value in matched_values:
+                    if value is None:
+                        continue
                     try:
-                        APINumber(value)
-                        valid_values.append(value)
+                        valid_values.append((value, APINumber(value)))
                     except Exception:
                         pass
 
-                # Remove Null values from valid_values
-                valid_values = [x for x in valid_values if x is not None]
-
                 # If there are matched values, check if they have the same
                 # first 10 characters
                 if len(valid_values) > 0:
+                    # Compare the rest of the values to the first one
+                    ref = valid_values[0][1].unformatted_10_digit
                     if all(
-                        APINumber(x).unformatted_10_digit == APINumber(
-                            valid_values[0]
-                            ).unformatted_10_digit
-                        for x in valid_values
+                        api.unformatted_10_digit == ref
+                        for _, api in valid_values[1:]
                     ):
-                        return APINumber(valid_values[0])
+                        return valid_values[0][1]
                     else:
                         # If they don't have the same first 10 characters,
-                        # return the longest valid_value as an APINumber
-                        return APINumber(max(valid_values, key=len))
+                        # return the APINumber of the longest valid value, the
+                        # first one if several are equally long
+                        longest_value, longest_api = valid_values[0]
+                        for value, api in valid_values[1:]:
+                            if len(value) > len(longest_value):
+                                longest_value, longest_api = value, api
+                        return longest_api
                 else:
                     return None
             except Exception as e:
@@ -2948,43 +3103,48 @@ def api_from_las(input):
     # If the las has a well section, try to get the api from it
     if hasattr(las, 'well'):
         try:
-            # Check if 'UWI', 'uwi', 'API', or 'api' is present in the
+            # Check if 'UWI' or 'API' in any case is present in the
             # 'mnemonic' column
-            mask = getattr(las, "well").df['mnemonic'].str.lower().isin(
-                ['uwi', 'api']
+            mask = getattr(las, "well").df['mnemonic'].str.upper().isin(
+                _UWI_API
             )
-            # Filter the DataFrame using the mask
-            filtered_df = getattr(las, "well").df[mask]
-            # Get the corresponding values for the matched mnemonics
-            matched_values = filtered_df['value'].tolist()
-
-            # Attempt to load all matched values into an APINumber
-            # objects
+            # Get the values for the matched mnemonics straight from the
+            # value column rather than filtering the whole DataFrame
+            matched_values = getattr(las, "well").df['value'].to_numpy()[
+                mask.to_numpy()
+            ].tolist()
+
+            # Attempt to load all non null matched values into APINumber
+            # objects, keeping each valid value with its APINumber so
+            # none have to be built again
             valid_values = []
             for value in matched_values:
+                if value is None:
+                    continue
                 try:
-                    APINumber(value)
-                    valid_values.append(value)
+                    valid_values.append((value, APINumber(value)))
                 except Exception:
                     pass
 
-            # Remove Null values from valid_values
-            valid_values = [x for x in valid_values if x is not None]
-
             # If there are matched values, check if they have the same
             # first 10 characters
             if len(valid_values) > 0:
+                # Compare the rest of the values to the first one
+                ref = valid_values[0][1].unformatted_10_digit
                 if all(
-                    APINumber(x).unformatted_10_digit == APINumber(
-                        valid_values[0]
-                        ).unformatted_10_digit
-                    for x in valid_values
+                    api.unformatted_10_digit == ref
+                    for _, api in valid_values[1:]
                 ):
-                    return APINumber(valid_values[0])
+                    return valid_values[0][1]
                 else:
                     # If they don't have the same first 10 characters,
-                    # return the longest valid_value as an APINumber
-                    return APINumber(max(valid_values, key=len))
+                    # return the APINumber of the longest valid value, the
+                    # first one if several are equally long
+                    longest_value, longest_api = valid_values[0]
+                    for value, api in valid_values[1:]:
+                        if len(value) > len(longest_value):
+                            longest_value, longest_api = value, api
+                    return longest_api
             else:
                 return None
         except Exception as e:
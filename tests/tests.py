@@ -1,7 +1,9 @@
 import os
 import glob
+import tempfile
 # For running the test on github actions
 from src.lasfile.lasfile import LASFile, api_from_las, error_check
+from src.lasfile.lasfile import parse_header_section, validate_version
 
 # For running the test not on github actions
 # import sys
@@ -14,6 +16,27 @@ def get_test_las_paths():
     return glob.glob(os.path.join(os.path.dirname(__file__), '*.las'))
 
 
+# Glob the test las files once for all of the tests
+_TEST_LAS_PATHS = get_test_las_paths()
+# Parse each test las file once for all of the tests
+_PARSED = {
+    las_path: LASFile(file_path=las_path) for las_path in _TEST_LAS_PATHS
+}
+
+
+def _parse_modified(name, old, new, binary=False):
+    """Parses a copy of a test las file with old replaced by new"""
+    mode = 'b' if binary else ''
+    las_path = os.path.join(os.path.dirname(__file__), name)
+    with open(las_path, 'r' + mode) as f:
+        text = f.read().replace(old, new)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        modified_path = os.path.join(tmp_dir, name)
+        with open(modified_path, 'w' + mode) as f:
+            f.write(text)
+        return LASFile(file_path=modified_path)
+
+
 # Dictionary of file name tags to version numbers
 version_dict = {
     '1_2': '1.2',
@@ -24,7 +47,7 @@ version_dict = {
 
 def test_read_las():
     """Tests that las files can be read"""
-    for las_path in get_test_las_paths():
+    for las_path in _TEST_LAS_PATHS:
         version = None
         # Get the version number from the file name
         for tag, ver in version_dict.items():
@@ -33,14 +56,15 @@ def test_read_las():
         if version is None:
             break
         # Test that the file can be read
-        las = LASFile(file_path=las_path)
+        las = _PARSED[las_path]
         assert las is not None
         # Test that the version section is present, the version
         # number is correct, and that there are no errors in
         # parsing or validating the version section
-        assert 'open_error' not in vars(las).keys()
-        assert 'version_error' not in vars(las).keys()
-        assert 'version_tb' not in vars(las).keys()
+        las_vars = vars(las)
+        assert 'open_error' not in las_vars
+        assert 'version_error' not in las_vars
+        assert not hasattr(las, 'version_tb')
         assert las.version is not None
         assert las.version_num == version
         assert las.version.validated
@@ -49,16 +73,90 @@ def test_read_las():
         assert getattr(las, "well") is not None
         assert getattr(las, "curves") is not None
         assert getattr(las, "data") is not None
+        assert 'well' in dir(las)
         # Run the error check function to check for critical errors
         assert error_check(las) is True
 
 
 def test_api_from_las():
     """Tests that the API can be calculated from a las file"""
-    for las_path in get_test_las_paths():
-        # try the file paths
-        assert api_from_las(las_path) is not None
+    for las_path in _TEST_LAS_PATHS:
+        # try the already parsed files
+        assert api_from_las(_PARSED[las_path]) is not None
+    # try a file path once to cover reading inside api_from_las
+    assert api_from_las(_TEST_LAS_PATHS[0]) is not None
+
+
+def test_validate_version_empty_dlm():
+    """Tests that an empty DLM value is accepted for version 3.0"""
+    df = parse_header_section(
+        "~Version\n"
+        " VERS.  3.0 : CWLS LOG ASCII STANDARD -VERSION 3.0\n"
+        " WRAP.  NO  : ONE LINE PER DEPTH STEP\n"
+        " DLM .      : DELIMITING CHARACTER\n",
+        version_num='3.0'
+    )
+    assert validate_version(df, version_num='3.0') == []
+
+
+def test_wrapped_data_bad_value():
+    """Tests that a non numeric value in wrapped data is read as NaN
+    rather than failing the data section"""
+    las = _parse_modified('las_2_0_ex_3.las', '2692.7075', 'ABC')
+    assert las.data.df.shape == (5, 36)
+    assert las.data.df.isna().sum().sum() == 1
+    assert error_check(las) is True
+
+
+def test_wrapped_data_missing_curve():
+    """Tests that wrapped data with a curve missing from the curves section
+    is read as an empty frame and flagged as not congruent"""
+    las = _parse_modified(
+        'las_2_0_ex_3.las', 'DT .US/M : 1 Sonic Travel Time\n', ''
+    )
+    assert las.data.df.shape == (0, 1)
+    assert 'parse_errors' not in las.errors
+    assert 'Curves and data sections are not congruent.' in [
+        str(err) for err in las.data.validate_errors
+    ]
+
+
+def test_header_df_matches_raw_data():
+    """Tests that each header section's DataFrame is parsed from that
+    section's own raw data, including when a value contains a '~'"""
+    tilde_las = _parse_modified(
+        'las_2_0_ex_1.las', 'ANY OIL COMPANY', 'ANY ~OIL COMPANY'
+    )
+    for las in list(_PARSED.values()) + [tilde_las]:
+        for section in las.sections:
+            if section.type != 'header' or not hasattr(section, 'df'):
+                continue
+            expected = parse_header_section(
+                section.raw_data,
+                version_num=las.version_num
+            )
+            assert (
+                section.df['mnemonic'].tolist() ==
+                expected['mnemonic'].tolist()
+            )
+
+
+def test_read_legacy_byte():
+    """Tests that a file with a non utf-8 legacy byte can still be read"""
+    las = _parse_modified(
+        'las_2_0_ex_1.las',
+        b'ANY OIL COMPANY',
+        b'ANY OIL\xb0 COMPANY',
+        binary=True
+    )
+    assert not hasattr(las, 'read_error')
+    assert error_check(las) is True
 
 
 test_read_las()
 test_api_from_las()
+test_validate_version_empty_dlm()
+test_wrapped_data_bad_value()
+test_wrapped_data_missing_curve()
+test_header_df_matches_raw_data()
+test_read_legacy_byte()